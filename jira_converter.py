@@ -1,6 +1,8 @@
 import os.path
 from argparse import ArgumentParser, ArgumentTypeError
+import bisect
 import calendar
+import itertools
 import logging
 import re
 from datetime import (
@@ -8,6 +10,7 @@ from datetime import (
     datetime,
     timedelta,
 )
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
@@ -22,15 +25,18 @@ from openpyxl.styles import (
     Alignment,
     Border,
     Font,
+    NamedStyle,
     Side,
 )
+from openpyxl.styles.builtins import styles as builtin_styles
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.workbook.workbook import Workbook
 
 # Types
 _T_GENERATED_DATA = List[List[Any]]
 _T_MERGE_DATA = List[Tuple[int, int, int, int]]
 _T_CORDS = Tuple[int, int]
+_T_BORDERS_PLAN = Dict[_T_CORDS, Dict[Literal['top', 'left', 'right', 'bottom'], Side]]
 _T_STYPE_BORDER = List[Dict[Tuple[_T_CORDS, _T_CORDS] | Literal['full'], Border | bool]]
 _T_STYLE_DATA = Dict[Literal['all', 'borders'] | Tuple[_T_CORDS, _T_CORDS], Dict[str, Any] | _T_STYPE_BORDER]
 
@@ -39,6 +45,8 @@ def get_weeks_for_year(year: Optional[int] = None) -> Dict[date, date]:
     """
     Get weeks dict for year
 
+    Result is cached per year and shared between callers, so it must not be mutated
+
     :param year: Year
 
     :return: Weeks dict for year:
@@ -50,21 +58,57 @@ def get_weeks_for_year(year: Optional[int] = None) -> Dict[date, date]:
     if year is None:
         year = datetime.today().year
 
-    calendar_object = calendar.Calendar(0)
-    weeks = [calendar_object.monthdatescalendar(year, month_i) for month_i in range(1, 13)]
-    weeks = [(x[0], x[-1]) for row in weeks for x in row]
-    weeks = {x[0]: x[1] for x in (sorted(set(weeks)))}
+    return _get_weeks_for_year(year)
+
+
+@lru_cache(maxsize=8)
+def _get_weeks_for_year(year: int) -> Dict[date, date]:
+    year_start = date(year, 1, 1)
+    year_end = date(year, 12, 31)
+    week_start = year_start - timedelta(days=year_start.weekday())
+    weeks = {}
+    while week_start <= year_end:
+        weeks[week_start] = week_start + timedelta(days=6)
+        week_start += timedelta(days=7)
 
     return weeks
 
 
+@lru_cache(maxsize=8)
+def get_week_indexes_for_year(year: int) -> Dict[date, int]:
+    """
+    Get week indexes dict for year
+
+    Result is cached per year and shared between callers, so it must not be mutated
+
+    :param year: Year
+
+    :return: Week indexes dict for year:
+    {
+        week_1_start_dt: 0,
+        ...
+    }
+    """
+    return {week_start: week_i for week_i, week_start in enumerate(get_weeks_for_year(year))}
+
+
 class Const:
     class Scheduler:
         WORK_HOURS_PER_DAY = 8
         WORK_DAYS_PER_WEEK = 5
+        WORK_HOURS_PER_WEEK = WORK_DAYS_PER_WEEK * WORK_HOURS_PER_DAY
+
+    class Styles:
+        WORKLOAD_NUMBER_FORMAT = '0.00%'
+        WORKLOAD_BAD = 'Workload Bad'
+        WORKLOAD_NEUTRAL = 'Workload Neutral'
+        WORKLOAD_GOOD = 'Workload Good'
 
 
 class Task:
+    _FIELDS = ('name', 'key', 'priority', 'status', 'estimate', 'date_start', 'date_end')
+    _PATTERN_USER = re.compile(r'JIRAUSER\d+|\w\.\w+')
+
     def __init__(
         self,
         name: str,
@@ -82,8 +126,10 @@ class Task:
         self._estimate = estimate
         self._date_start = date_start
         self._date_end = date_end
+        self._workload_by_year: Dict[int, List[int | float]] = {}
 
-        LOGGER.info(f'Task created: {dict(self)}')
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info('Task created: %s', dict(self))
 
     @property
     def name(self) -> str:
@@ -113,6 +159,28 @@ class Task:
     def estimate(self) -> Optional[int]:
         return self._estimate
 
+    def get_workload_for_year(self, year: int) -> List[int | float]:
+        """
+        Get task workload for year
+
+        Result is cached per year and shared between workers of the task, so it must not be mutated
+
+        :param year: Year
+
+        :return: Task workload for year:
+        [week_1_workload, ...]
+        """
+        if year not in self._workload_by_year:
+            weeks_count = len(get_weeks_for_year(year))
+            start_monday = self._date_start - timedelta(days=self._date_start.weekday())
+            weeks_for_task = abs(-(self._date_end - start_monday).days // 7)
+            workload = round(float(self._estimate / (Const.Scheduler.WORK_HOURS_PER_WEEK * weeks_for_task)), 4)
+            start_week_index = get_week_indexes_for_year(year)[start_monday]
+            weeks_after_task = weeks_count - start_week_index - weeks_for_task
+            self._workload_by_year[year] = [0] * start_week_index + [workload] * weeks_for_task + [0] * weeks_after_task
+
+        return self._workload_by_year[year]
+
     @staticmethod
     def is_jira_key(key: str) -> bool:
         """
@@ -123,16 +191,12 @@ class Task:
         :return: String is actual JIRA task key
         :rtype:  bool
         """
-        pattern_jirauser = r'JIRAUSER\d+'
-        pattern_user = r'\w\.\w+'
-
-        result = not (re.match(pattern_user, key) or re.match(pattern_jirauser, key))
+        result = Task._PATTERN_USER.match(key) is None
 
         return result
 
     def __iter__(self):
-        result = {x: self.__getattribute__(x) for x in dir(self) if not x.startswith('_')}
-        return iter(result.items())
+        return iter((x, getattr(self, f'_{x}')) for x in self._FIELDS)
 
     def __repr__(self):
         return f'Task[{self.key}]'
@@ -147,7 +211,7 @@ class Worker:
         self._username = username
         self._tasks = [] if tasks is None else tasks.copy()
 
-        LOGGER.info(f'Worker created: {{"name": {self._name}}}')
+        LOGGER.info('Worker created: {"name": %s}', self._name)
 
     @property
     def name(self) -> str:
@@ -161,6 +225,10 @@ class Worker:
     def tasks(self) -> List[Task]:
         return self._tasks.copy()
 
+    @property
+    def has_tasks(self) -> bool:
+        return bool(self._tasks)
+
     def add_task(self, task: Task) -> None:
         """
         Add task to worker
@@ -170,12 +238,14 @@ class Worker:
         :return: None
         """
         self._tasks.append(task)
-        LOGGER.info(f'{task} was added to {self}')
+        LOGGER.info('%s was added to %s', task, self)
 
     def get_workload_by_tasks_for_year(self, year: Optional[int] = None) -> Dict[Task, List[int | float]]:
         """
         Get worker workload grouped by tasks for year
 
+        Task workloads are cached on tasks and shared between workers, so they must not be mutated
+
         :param year: Year
 
         :return: Workload by tasks for year:
@@ -186,37 +256,36 @@ class Worker:
         """
         if year is None:
             year = datetime.today().year
-        weeks = get_weeks_for_year(year)
-        result = {task: [0 for _ in range(len(weeks))] for task in self._tasks}
-
-        for task, workload in result.items():
-            task_start_monday = task.date_start - timedelta(days=task.date_start.weekday())
-            weeks_for_task = abs(-(task.date_end - task_start_monday).days // 7)
-            hours_per_week = Const.Scheduler.WORK_DAYS_PER_WEEK * Const.Scheduler.WORK_HOURS_PER_DAY
-            workload = round(float(task.estimate / (hours_per_week * weeks_for_task)), 4)
-            task_start_week_index = list(weeks).index(task_start_monday)
-            for i in range(weeks_for_task):
-                result[task][task_start_week_index + i] = workload
+        result = {task: task.get_workload_for_year(year) for task in self._tasks}
 
-        LOGGER.debug(f'{self} workload by tasks: {result}')
+        LOGGER.debug('%s workload by tasks: %s', self, result)
 
         return result
 
-    def get_workload_summary_for_year(self, year: Optional[int] = None) -> List[int | float]:
+    def get_workload_summary_for_year(
+        self,
+        year: Optional[int] = None,
+        workload_by_tasks: Optional[Dict[Task, List[int | float]]] = None,
+    ) -> List[int | float]:
         """
         Get worker workload summary for year
 
         :param year: Year
+        :param workload_by_tasks: Precomputed result of get_workload_by_tasks_for_year for the same year
 
         :return: Workload summary for year:
         [week_1_workload_summary, ...]
         """
         if self._name == 'Тополог (не распределенный ресурс)':
             pass
-        workload_by_tasks = self.get_workload_by_tasks_for_year(year)
-        result = [round(sum([workload_by_tasks[task][i] for task in workload_by_tasks]), 4) for i in range(len(get_weeks_for_year(year)))]  # type: ignore  # noqa
+        if workload_by_tasks is None:
+            workload_by_tasks = self.get_workload_by_tasks_for_year(year)
+        if workload_by_tasks:
+            result = [round(sum(x), 4) for x in zip(*workload_by_tasks.values())]
+        else:
+            result = [0] * len(get_weeks_for_year(year))
 
-        LOGGER.debug(f'{self}: workload summary for year: {result}')
+        LOGGER.debug('%s: workload summary for year: %s', self, result)
 
         return result
 
@@ -228,7 +297,7 @@ class Department:
     def __init__(self, name: str, workers: Optional[List[Worker]] = None):
         self._name = name
         if isinstance(workers, list):
-            self._workers = workers.copy()
+            self._workers = sorted(workers, key=lambda x: x.username)
         else:
             self._workers = []
 
@@ -242,26 +311,33 @@ class Department:
 
     def add_worker(self, worker: Worker) -> None:
         """
-        Add worker to department workers list
+        Add worker to department workers list (kept sorted by username)
 
         :param worker: Worker object
 
         :return: None
         """
-        self._workers.append(worker)
+        bisect.insort(self._workers, worker, key=lambda x: x.username)
 
-    def get_department_workload(self, year: int) -> Optional[List[int | float]]:
+    def get_department_workload(
+        self,
+        year: int,
+        workload_summaries: Optional[List[List[int | float]]] = None,
+    ) -> Optional[List[int | float]]:
         """
         Get department workload for year
         :param year: Year
+        :param workload_summaries: Precomputed workload summaries of every department worker for the same year.
+            Summaries are summed in the given order, which may shift rounded averages by 0.0001
 
         :return: Department workload
         :rtype:  [week_1_workload_summary, ...]
         """
         if self._workers:
-            result = [worker.get_workload_summary_for_year(year) for worker in self._workers]
-            result = [[x[i] for x in result] for i in range(len(result[0]))]
-            result = [round(sum(x) / len(x), 4) for x in result]
+            if workload_summaries is None:
+                workload_summaries = [worker.get_workload_summary_for_year(year) for worker in self._workers]
+            workers_count = len(workload_summaries)
+            result = [round(sum(x) / workers_count, 4) for x in zip(*workload_summaries)]
 
             return result
 
@@ -273,9 +349,9 @@ class Scheduler:
         workers: List[Worker],
         tasks: List[Task],
     ):
-        self._departments = departments.copy()
-        self._workers = workers.copy()
-        self._tasks = tasks.copy()
+        self._departments = sorted(departments, key=lambda x: x.name)
+        self._workers = workers
+        self._tasks = tasks
 
     def generate_data(
         self,
@@ -328,18 +404,16 @@ class Scheduler:
         style_data: _T_STYLE_DATA = {'borders': []}
 
         # Months
-        months_weeks_mapping = {month: [] for month in list(calendar.month_name)}
-        months_weeks_mapping.pop('')
+        month_names = list(calendar.month_name)[1:]
+        months_weeks_mapping = {month: [] for month in month_names}
         for week in weeks.items():
             week_start, week_end = week
-            if week_start.month == week_end.month:
-                months_weeks_mapping[list(months_weeks_mapping)[week_start.month - 1]].append(week)
-            elif week_start.year == YEAR - 1:
-                months_weeks_mapping[list(months_weeks_mapping)[0]].append(week)
-            elif week_end.year == YEAR + 1:
-                months_weeks_mapping[list(months_weeks_mapping)[11]].append(week)
+            if week_start.year == year - 1:
+                months_weeks_mapping[month_names[0]].append(week)
+            elif week_end.year == year + 1:
+                months_weeks_mapping[month_names[11]].append(week)
             else:
-                months_weeks_mapping[list(months_weeks_mapping)[week_start.month - 1]].append(week)
+                months_weeks_mapping[month_names[week_start.month - 1]].append(week)
         month_headers = []
         for month_name, month_weeks in months_weeks_mapping.items():
             month_headers.append(month_name)
@@ -354,14 +428,21 @@ class Scheduler:
 
         # Main data
         department_cords = []
-        for department in sorted(self._departments, key=lambda x: x.name):
-            if department.workers and any([worker.tasks for worker in department.workers]):
-                data.append([department.name] + [''] * (len(base_headers) - 1) + department.get_department_workload(year))  # noqa
+        for department in self._departments:
+            department_workers = department.workers
+            if any(worker.has_tasks for worker in department_workers):
+                workers_data = []
+                for worker in department_workers:
+                    workload_by_tasks = worker.get_workload_by_tasks_for_year(year)
+                    workload_summary = worker.get_workload_summary_for_year(year, workload_by_tasks)
+                    workers_data.append((worker, workload_summary, workload_by_tasks))
+                department_workload = department.get_department_workload(year, [x[1] for x in workers_data])
+                data.append([department.name] + [''] * (len(base_headers) - 1) + department_workload)  # noqa
                 department_cords_temp = (len(data), 1)
                 style_data[(department_cords_temp, department_cords_temp)] = {'font': Font(bold=True)}
-                for worker in sorted(department.workers, key=lambda x: x.username):
-                    data.append([worker.name] + [''] * (len(base_headers) - 1) + worker.get_workload_summary_for_year(year))  # noqa
-                    for task, workload in worker.get_workload_by_tasks_for_year(year).items():
+                for worker, workload_summary, workload_by_tasks in workers_data:
+                    data.append([worker.name] + [''] * (len(base_headers) - 1) + workload_summary)  # noqa
+                    for task, workload in workload_by_tasks.items():
                         data.append([worker.name, task.name, task.key] + workload)  # noqa
                 department_cords_temp = (department_cords_temp, (len(data), len(base_headers) + len(weeks)))
                 department_cords.append(department_cords_temp)
@@ -400,21 +481,26 @@ class Scheduler:
         })
 
         # --- Styles by cell value
+        # --- --- Adjacent cells with the same style are grouped into a single range per row
         for row_i in range(len(base_headers), len(data)):
-            for col_i in range(3, len(data[row_i])):
-                value = data[row_i][col_i]
+            row_styles = []
+            for value in data[row_i][3:]:
                 if isinstance(value, (int, float)):
                     if value > 1:
-                        style = 'Bad'
+                        row_styles.append(Const.Styles.WORKLOAD_BAD)
                     elif 0 < value < 1:
-                        style = 'Neutral'
+                        row_styles.append(Const.Styles.WORKLOAD_NEUTRAL)
                     else:
-                        style = 'Good'
-                    cords = ((row_i + 1, col_i + 1), (row_i + 1, col_i + 1))
-                    style_data.setdefault(cords, {})
-                    style_data[cords].update({'style': style, 'number_format': '0.00%'})
+                        row_styles.append(Const.Styles.WORKLOAD_GOOD)
                 else:
-                    ...  # Log warning
+                    row_styles.append(None)  # Log warning
+            col_i = 4
+            for style, style_group in itertools.groupby(row_styles):
+                style_group_length = len(list(style_group))
+                if style is not None:
+                    cords = ((row_i + 1, col_i), (row_i + 1, col_i + style_group_length - 1))
+                    style_data[cords] = {'style': style}
+                col_i += style_group_length
 
         # --- Borders
         base_border_side = Side(border_style='thin', color='000000')
@@ -446,26 +532,51 @@ class Scheduler:
         })  # Bold border for base headers column
         for department_cord in department_cords:
             style_data['borders'].append({department_cord: bold_border})
-        for row in data:
-            LOGGER.info(f'Data generated: {row}')
-        for row in merge_data:
-            LOGGER.debug(f'Merge data: {row}')
-        for key, value in style_data.items():
-            LOGGER.debug(f'Style data: {key}: {value}')
+        LOGGER.info('Data generated: %s rows', len(data))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            for row in data:
+                LOGGER.debug('Data generated: %s', row)
+            for row in merge_data:
+                LOGGER.debug('Merge data: %s', row)
+            for key, value in style_data.items():
+                LOGGER.debug('Style data: %s: %s', key, value)
 
         return data, merge_data, style_data
 
     @staticmethod
-    def apply_border(
-        worksheet: Worksheet,
+    def add_named_styles(workbook: Workbook) -> None:
+        """
+        Add workload named styles to workbook
+
+        :param workbook: Workbook object
+
+        :return: None
+        """
+        for style_name, builtin_style_name in (
+            (Const.Styles.WORKLOAD_BAD, 'Bad'),
+            (Const.Styles.WORKLOAD_NEUTRAL, 'Neutral'),
+            (Const.Styles.WORKLOAD_GOOD, 'Good'),
+        ):
+            builtin_style = builtin_styles[builtin_style_name]
+            workbook.add_named_style(NamedStyle(
+                name=style_name,
+                font=builtin_style.font,
+                fill=builtin_style.fill,
+                border=builtin_style.border,
+                number_format=Const.Styles.WORKLOAD_NUMBER_FORMAT,
+            ))
+
+    @staticmethod
+    def plan_border(
+        borders_plan: _T_BORDERS_PLAN,
         cells_range: Tuple[_T_CORDS, _T_CORDS],
         border: Border,
         full: bool = False,
-    ):
+    ) -> None:
         """
-        Apply border by given cords
+        Add border by given cords to borders plan
 
-        :param worksheet: Worksheet object
+        :param borders_plan: Borders plan to update
         :param cells_range: Cells range
         :param border: Border object
         :param full: Apply border to every cell in given range if true or to outer ones only
@@ -473,43 +584,19 @@ class Scheduler:
         :return: None
         """
         if full:
-            LOGGER.debug(f'Applying full border to {cells_range} ...')
+            LOGGER.debug('Planning full border for %s ...', cells_range)
+            border_sides = {'top': border.top, 'left': border.left, 'right': border.right, 'bottom': border.bottom}
             for row_i in range(cells_range[0][0], cells_range[1][0] + 1):
                 for col_i in range(cells_range[0][1], cells_range[1][1] + 1):
-                    cell = worksheet.cell(row_i, col_i)
-                    cell.border = border  # noqa: It's not read-only
+                    borders_plan.setdefault((row_i, col_i), {}).update(border_sides)
         else:
-            LOGGER.debug(f'Applying outer border to {cells_range} ...')
+            LOGGER.debug('Planning outer border for %s ...', cells_range)
             for row_i in range(cells_range[0][0], cells_range[1][0] + 1):
-                cell = worksheet.cell(row_i, cells_range[0][1])
-                cell.border = Border(  # noqa: It's not read-only
-                    top=cell.border.top,
-                    left=border.left,
-                    right=cell.border.right,
-                    bottom=cell.border.bottom,
-                )
-                cell = worksheet.cell(row_i, cells_range[1][1])
-                cell.border = Border(  # noqa: It's not read-only
-                    top=cell.border.top,
-                    left=cell.border.left,
-                    right=border.right,
-                    bottom=cell.border.bottom,
-                )
+                borders_plan.setdefault((row_i, cells_range[0][1]), {})['left'] = border.left
+                borders_plan.setdefault((row_i, cells_range[1][1]), {})['right'] = border.right
             for col_i in range(cells_range[0][1], cells_range[1][1] + 1):
-                cell = worksheet.cell(cells_range[0][0], col_i)
-                cell.border = Border(  # noqa: It's not read-only
-                    top=border.top,
-                    left=cell.border.left,
-                    right=cell.border.right,
-                    bottom=cell.border.bottom,
-                )
-                cell = worksheet.cell(cells_range[1][0], col_i)
-                cell.border = Border(  # noqa: It's not read-only
-                    top=cell.border.top,
-                    left=cell.border.left,
-                    right=cell.border.right,
-                    bottom=border.bottom,
-                )
+                borders_plan.setdefault((cells_range[0][0], col_i), {})['top'] = border.top
+                borders_plan.setdefault((cells_range[1][0], col_i), {})['bottom'] = border.bottom
 
     def write_data_to_excel(
         self,
@@ -534,12 +621,20 @@ class Scheduler:
         LOGGER.info('Creating workbook ...')
         workbook = openpyxl.Workbook()
         sheet = workbook.active
+        self.add_named_styles(workbook)
 
         # Write data
         LOGGER.info('Writing raw data ...')
+        column_widths = []
         for row_i, row in enumerate(data, 1):
-            for col_i, value in enumerate(row, 1):
-                sheet.cell(row_i, col_i).value = value
+            sheet.append(row)
+            if row_i < 4:  # Headers do not affect column widths
+                continue
+            if len(row) > len(column_widths):
+                column_widths.extend([0] * (len(row) - len(column_widths)))
+            for col_i, value in enumerate(row):
+                if (value_width := len(str(value))) > column_widths[col_i]:
+                    column_widths[col_i] = value_width
 
         # Merge cells
         LOGGER.info('Merging cells ...')
@@ -548,57 +643,81 @@ class Scheduler:
                 sheet.merge_cells(**dict(zip(["start_row", "start_column", "end_row", "end_column"], merge_cell_data)))
 
         # Add style
-
-        # --- Apply styles by cords
-        # --- --- Cords
         if style_data:
-            LOGGER.info('Applying styles by given cords ...')
+            # --- Plan styles by cords
+            LOGGER.info('Planning styles by given cords ...')
+            styles_plan: Dict[_T_CORDS, Dict[str, Any]] = {}
             for cords, style in style_data.items():
                 if cords in ['all', 'borders']:
                     continue
                 for row_i in range(cords[0][0], cords[1][0] + 1):  # noqa
                     for col_i in range(cords[0][1], cords[1][1] + 1):  # noqa
-                        for style_obj, value in style.items():
-                            sheet.cell(row_i, col_i).__setattr__(style_obj, value)
-
-        # --- --- All
-            if style_data['all']:
-                LOGGER.info('Applying styles for all cells ...')
-                for row_i in range(1, sheet.max_row + 1):
-                    for col_i in range(1, sheet.max_column + 1):
-                        for style_obj, value in style_data['all'].items():
-                            sheet.cell(row_i, col_i).__setattr__(style_obj, value)
-
-        # --- --- Borders
-            if style_data['borders']:
-                LOGGER.info('Applying borders by given cords ...')
-                for border_style in style_data['borders']:
-                    for border_cords, border in border_style.items():
-                        if isinstance(border_cords, tuple):
-                            self.apply_border(
-                                worksheet=sheet,
-                                cells_range=border_cords,
-                                border=border,
-                                full=border_style.get('full', False),
+                        styles_plan.setdefault((row_i, col_i), {}).update(style)
+
+            # --- Plan borders
+            LOGGER.info('Planning borders by given cords ...')
+            borders_plan: _T_BORDERS_PLAN = {}
+            for border_style in style_data['borders']:
+                for border_cords, border in border_style.items():
+                    if isinstance(border_cords, tuple):
+                        self.plan_border(
+                            borders_plan=borders_plan,
+                            cells_range=border_cords,
+                            border=border,
+                            full=border_style.get('full', False),
+                        )
+
+            # --- Apply styles: cords, then all, then borders for every cell in a single pass
+            LOGGER.info('Applying styles ...')
+            borders_cache: Dict[Tuple[Side, Side, Side, Side], Border] = {}
+            max_row = max([sheet.max_row] + [x[0] for x in styles_plan])
+            max_col = max([sheet.max_column] + [x[1] for x in styles_plan])
+            for row in sheet.iter_rows(min_row=1, max_row=max_row, max_col=max_col):
+                for cell in row:
+                    cords = (cell.row, cell.column)
+                    for style_obj, value in styles_plan.get(cords, {}).items():
+                        setattr(cell, style_obj, value)
+                    for style_obj, value in style_data['all'].items():
+                        setattr(cell, style_obj, value)
+                    if cords in borders_plan:
+                        border_sides = borders_plan[cords]
+                        if len(border_sides) == 4:
+                            border_key = (
+                                border_sides['top'],
+                                border_sides['left'],
+                                border_sides['right'],
+                                border_sides['bottom'],
                             )
+                        else:
+                            cell_border = cell.border
+                            border_key = (
+                                border_sides.get('top', cell_border.top),
+                                border_sides.get('left', cell_border.left),
+                                border_sides.get('right', cell_border.right),
+                                border_sides.get('bottom', cell_border.bottom),
+                            )
+                        if border_key not in borders_cache:
+                            borders_cache[border_key] = Border(
+                                top=border_key[0],
+                                left=border_key[1],
+                                right=border_key[2],
+                                bottom=border_key[3],
+                            )
+                        cell.border = borders_cache[border_key]  # noqa: It's not read-only
 
         # --- Adjust column widths
         LOGGER.info('Adjusting column widths ...')
-        column_widths = [
-            max([len(str(sheet.cell(row_index, column_index).value)) for row_index in range(4, sheet.max_row + 1)])
-            for column_index in range(1, sheet.max_column + 1)
-        ]
         for column_index, column_width in enumerate(column_widths, 1):
             sheet.column_dimensions[get_column_letter(column_index)].width = column_width + 5
 
         # --- Freeze
         if freeze_cell:
             cell_name = get_column_letter(freeze_cell[1]) + str(freeze_cell[0])
-            LOGGER.info(f'Freezing cell "{cell_name}" ...')
+            LOGGER.info('Freezing cell "%s" ...', cell_name)
             sheet.freeze_panes = cell_name
 
         # Save workbook
-        LOGGER.info(f'Saving workbook to "{filename}" ...')
+        LOGGER.info('Saving workbook to "%s" ...', filename)
         workbook.save(filename)
 
         return
@@ -612,21 +731,28 @@ def main():
     # Read excel workbook
     workbook = openpyxl.load_workbook(INPUT_FILENAME, read_only=True)
     sheet = workbook.active
-    sheet_values = list(sheet.values)
-    workbook.close()
-    raw_book_data = [{sheet_values[0][i]: row[i] for i in range(len(sheet_values[0]))} for row in sheet_values[1:]]
+    sheet_rows = sheet.iter_rows(values_only=True)
+    headers = {header: header_i for header_i, header in enumerate(next(sheet_rows))}
+    key_i = headers['Key']
+    task_name_i = headers['Summary']
+    task_status_i = headers['Status']
+    assignee_i = headers['Assignee']
+    start_date_i = headers['Start Date [Gantt]']
+    end_date_i = headers['End Date [Gantt]']
+    estimate_i = headers['Original Estimate']
+    priority_i = headers['Priority']
     group = None
     worker_username = None
 
-    for row in raw_book_data:
-        key = row['Key']
-        task_name = row['Summary']
-        task_status = row['Status']
-        assignee = row['Assignee']
-        start_date = row['Start Date [Gantt]']
-        end_date = row['End Date [Gantt]']
-        estimate = row['Original Estimate']
-        priority = row['Priority']
+    for row in sheet_rows:
+        key = row[key_i]
+        task_name = row[task_name_i]
+        task_status = row[task_status_i]
+        assignee = row[assignee_i]
+        start_date = row[start_date_i]
+        end_date = row[end_date_i]
+        estimate = row[estimate_i]
+        priority = row[priority_i]
 
         if key is None:
             group = task_name
@@ -690,8 +816,10 @@ def main():
         if workers[assignee] not in departments[group].workers:
             departments[group].add_worker(workers[assignee])
 
+    workbook.close()
+
     departments = [department for department in departments.values() if department.workers]
-    workers = [worker for worker in workers.values() if worker.tasks]
+    workers = [worker for worker in workers.values() if worker.has_tasks]
     scheduler = Scheduler(
         departments=departments,
         workers=workers,